@@ -1,71 +1,34 @@
+import os
 import yaml
-from pydantic import BaseModel, Field
-from typing import List
+from functools import lru_cache
+from config.schema import Config
 
 
-class AppConfigModel(BaseModel):
+@lru_cache(maxsize=1)
+def load_config(file_path="config/config.yaml") -> Config:
     """
-    Pydantic model for validating application settings from YAML.
-    """
-
-    name: str = Field(..., description="Application name")
-    version: str = Field(..., description="Application version")
-
-
-class NewsConfigModel(BaseModel):
-    """
-    Pydantic model for validating news-related configurations.
-    """
-
-    query_url: str = Field(..., description="URL for query-based news search")
-    allowed_queries: List[str] = Field(
-        ..., description="List of allowed finance-related queries"
-    )
+    Reads the YAML configuration file into immutable config dataclasses.
 
-
-class SentimentConfigModel(BaseModel):
-    """
-    Pydantic model for validating sentiment analysis model configurations.
-    """
-
-    name: str = Field(..., description="Name of the sentiment analysis model")
-    max_length: int = Field(
-        512, description="Maximum number of tokens for sentiment analysis"
-    )
-
-
-class ModelsConfig(BaseModel):
-    """
-    Pydantic model for validating the models section.
-    """
-
-    sentiment_analysis_model: SentimentConfigModel
-
-
-class ConfigModel(BaseModel):
-    """
-    Root Pydantic model for validating the entire configuration file.
-    """
-
-    app: AppConfigModel
-    news: NewsConfigModel
-    models: ModelsConfig
-
-
-def load_config(file_path="config/config.yaml") -> ConfigModel:
-    """
-    Reads and validates YAML configuration file using Pydantic.
+    The config file is trusted, so validation is skipped unless the
+    PYDANTIC_STRICT=1 environment variable is set. Run config/validate_config.py
+    to validate it explicitly (e.g. in CI). The result is cached, so the file
+    is parsed only once per process.
 
     Args:
         file_path (str): Path to the YAML config file.
 
     Returns:
-        ConfigModel: Validated configuration model.
+        Config: Configuration dataclass tree.
     """
     with open(file_path, "r") as file:
         raw_config = yaml.safe_load(file)
-    return ConfigModel(**raw_config)
+    if os.getenv("PYDANTIC_STRICT") == "1":
+        # Imported lazily so Pydantic models are only built when validating
+        from config.validate_config import ConfigModel
+
+        raw_config = ConfigModel.model_validate(raw_config).model_dump()
+    return Config.from_dict(raw_config)
 
 
-# Load and validate configuration
+# Load configuration
 app_config = load_config()
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # in this classes you have to be sure to name them in the same way in the pydantic (Settings and Config)
@@ -13,5 +14,11 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
 
+@lru_cache(maxsize=1)
 def get_settings():
+    """
+    Returns the application settings, read from .env once per process.
+
+    Also used as a FastAPI dependency; every request gets the same cached instance.
+    """
     return Settings()
@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class AppConfig:
+    """
+    Application settings from YAML.
+    """
+
+    name: str
+    version: str
+
+
+@dataclass(frozen=True)
+class NewsConfig:
+    """
+    News-related configurations.
+    """
+
+    query_url: str
+    allowed_queries: Tuple[str, ...]
+    storage_format: str = "csv"
+
+
+@dataclass(frozen=True)
+class SentimentConfig:
+    """
+    Sentiment analysis model configurations.
+    """
+
+    name: str
+    max_length: int = 512
+    quantize: bool = False
+    backend: str = "torch"
+
+
+@dataclass(frozen=True)
+class ModelsConfig:
+    """
+    The models section.
+    """
+
+    sentiment_analysis_model: SentimentConfig
+
+
+@dataclass(frozen=True)
+class Config:
+    """
+    Root of the runtime configuration.
+
+    Plain dataclasses keep config access cheap at runtime; validation lives in
+    config/validate_config.py.
+    """
+
+    app: AppConfig
+    news: NewsConfig
+    models: ModelsConfig
+
+    @classmethod
+    def from_dict(cls, raw_config: dict) -> "Config":
+        """
+        Builds the configuration from parsed YAML data.
+
+        Args:
+            raw_config (dict): Parsed content of the YAML config file.
+
+        Returns:
+            Config: The configuration dataclass tree.
+        """
+        news = dict(raw_config["news"])
+        news["allowed_queries"] = tuple(news["allowed_queries"])
+        models = raw_config["models"]
+        return cls(
+            app=AppConfig(**raw_config["app"]),
+            news=NewsConfig(**news),
+            models=ModelsConfig(
+                sentiment_analysis_model=SentimentConfig(
+                    **models["sentiment_analysis_model"]
+                )
+            ),
+        )
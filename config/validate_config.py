@@ -0,0 +1,89 @@
+import sys
+import yaml
+from pydantic import BaseModel, Field, ValidationError
+from typing import List, Literal
+
+
+class AppConfigModel(BaseModel):
+    """
+    Pydantic model for validating application settings from YAML.
+    """
+
+    name: str = Field(..., description="Application name")
+    version: str = Field(..., description="Application version")
+
+
+class NewsConfigModel(BaseModel):
+    """
+    Pydantic model for validating news-related configurations.
+    """
+
+    query_url: str = Field(..., description="URL for query-based news search")
+    allowed_queries: List[str] = Field(
+        ..., description="List of allowed finance-related queries"
+    )
+    storage_format: Literal["csv", "parquet"] = Field(
+        "csv", description="File format used to persist news articles"
+    )
+
+
+class SentimentConfigModel(BaseModel):
+    """
+    Pydantic model for validating sentiment analysis model configurations.
+    """
+
+    name: str = Field(..., description="Name of the sentiment analysis model")
+    max_length: int = Field(
+        512, description="Maximum number of tokens for sentiment analysis"
+    )
+    quantize: bool = Field(
+        False, description="Quantize the model to int8 for CPU inference"
+    )
+    backend: Literal["torch", "onnx"] = Field(
+        "torch", description="Inference backend for the sentiment model"
+    )
+
+
+class ModelsConfigModel(BaseModel):
+    """
+    Pydantic model for validating the models section.
+    """
+
+    sentiment_analysis_model: SentimentConfigModel
+
+
+class ConfigModel(BaseModel):
+    """
+    Root Pydantic model for validating the entire configuration file.
+    """
+
+    app: AppConfigModel
+    news: NewsConfigModel
+    models: ModelsConfigModel
+
+
+def validate_config(file_path="config/config.yaml") -> bool:
+    """
+    Validates the YAML configuration file against ConfigModel.
+
+    Args:
+        file_path (str): Path to the YAML config file.
+
+    Returns:
+        bool: True if the configuration is valid, False otherwise.
+    """
+    with open(file_path, "r") as file:
+        raw_config = yaml.safe_load(file)
+    try:
+        ConfigModel.model_validate(raw_config)
+    except ValidationError as e:
+        print(f"Invalid configuration in {file_path}:\n{e}")
+        return False
+
+    print(f"Configuration in {file_path} is valid.")
+    return True
+
+
+if __name__ == "__main__":
+    # Usage: python -m config.validate_config [path/to/config.yaml]
+    sys.exit(0 if validate_config(*sys.argv[1:2]) else 1)
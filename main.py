@@ -1,22 +1,92 @@
+import asyncio
+import logging
+import os
+import httpx
+import torch
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from src.routes import base, news, ranking
+from src.helpers.batch_helper import MicroBatcher
 
-# from src.helpers.log_helper import Logger  # Import your Logger helper
+# Configure logging handlers once for every module logger
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(name)s - %(message)s",
+)
 
 
-# Initialize logger
-# log_instance = Logger(log_name="app")
-# logger = log_instance.get_logger()
+def load_sentiment_model():
+    """
+    Loads and warms up the sentiment model once at startup so requests never pay
+    the load cost.
+    """
+    # Share the CPU cores between uvicorn workers to avoid thread oversubscription
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    torch.set_num_threads(max(1, (os.cpu_count() or 1) // workers))
 
-app = FastAPI(title="Financial News Ranking API")
+    # Run the full prediction path once (tokenizer, model, result mapping) so
+    # the first request does not pay for lazy initialization. predict_model
+    # loads the handler through the cached get_sentiment_model, so requests
+    # reuse this warm instance.
+    news_controller = news.get_news_controller()
+    news_controller.predict_model([{"title": "warmup", "text": "warmup"}])
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Sets up shared resources on startup and releases them on shutdown.
+    """
+    load_sentiment_model()
+
+    # Blocking controller work runs off the event loop: file IO and pandas
+    # processing in a small pool, model inference on a single warm thread
+    app.state.io_executor = ThreadPoolExecutor(thread_name_prefix="io")
+    app.state.model_executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="model"
+    )
+
+    # Articles from concurrent requests share sentiment model forward passes
+    app.state.sentiment_batcher = MicroBatcher(
+        news.get_news_controller().predict_model, executor=app.state.model_executor
+    )
+    app.state.sentiment_batcher.start()
+
+    # Bounds concurrent outbound News API calls to stay under its rate limit
+    app.state.news_api_semaphore = asyncio.Semaphore(8)
+
+    # One pooled client for all News API calls, so connections are reused
+    try:
+        async with httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=10.0,
+            http2=True,
+        ) as http_client:
+            app.state.http_client = http_client
+            yield
+    finally:
+        await app.state.sentiment_batcher.stop()
+        app.state.io_executor.shutdown(wait=True)
+        app.state.model_executor.shutdown(wait=True)
+
+
+app = FastAPI(
+    title="Financial News Ranking API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+# Compress large JSON article payloads on the wire
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # Register API routes
 app.include_router(base.base_router)
 app.include_router(news.news_router)
 app.include_router(ranking.ranking_router)
 
-# logger.info("FastAPI application has started.")
-
 if __name__ == "__main__":
     import uvicorn
 
@@ -1,13 +1,94 @@
+import os
+import uuid
+import pandas as pd
+from functools import partial
 from config.app_config import load_config
 from config.env_config import get_settings
 
 
 class BaseController:
 
+    # Configuration is loaded once at import time and shared by every controller
+    env_config = get_settings()
+    app_config = load_config()
+
+    # Precomputed once so request handling avoids rebuilding them per call
+    _allowed_queries_lc = frozenset(q.lower() for q in app_config.news.allowed_queries)
+    # The API key is constant per process, so only the query is left to fill in
+    _url_for = partial(
+        app_config.news.query_url.format, api_key=env_config.NEWS_API_KEY
+    )
+
     def __init__(self):
-        self.env_config = get_settings()
-        self.app_config = load_config()
         self.raw_data_path = "assets/raw_news.csv"  # Default path for raw data
         self.processed_data_path = (
             "assets/processed_news.csv"  # Default path for processed data
         )
+
+    def write_articles(self, df: pd.DataFrame, file_path: str) -> None:
+        """
+        Writes articles to disk in the configured storage format.
+
+        Args:
+            df (pd.DataFrame): Articles to save.
+            file_path (str): CSV path, swapped to .parquet for Parquet storage.
+        """
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        if self.app_config.news.storage_format == "parquet":
+            file_path = self._parquet_path(file_path)
+
+        # Write to a temporary file and swap it in, so saves running in the
+        # background never expose a half-written file to readers. Each write
+        # gets its own temporary file so concurrent saves cannot clobber it.
+        tmp_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            if self.app_config.news.storage_format == "parquet":
+                df.to_parquet(tmp_path, index=False)
+            else:
+                df.to_csv(tmp_path, index=False, encoding="utf-8")
+            os.replace(tmp_path, file_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def read_articles(self, file_path: str) -> pd.DataFrame:
+        """
+        Reads articles saved by write_articles.
+
+        With Parquet storage the CSV file is used as a fallback when no Parquet
+        file has been written yet.
+
+        Args:
+            file_path (str): CSV path, swapped to .parquet for Parquet storage.
+
+        Returns:
+            pd.DataFrame: The stored articles.
+        """
+        stored_path = self._stored_path(file_path)
+        if stored_path != file_path:
+            return pd.read_parquet(stored_path)
+
+        return pd.read_csv(file_path)
+
+    def _stored_path(self, file_path: str) -> str:
+        """
+        Resolves the file read_articles will load for the given CSV path.
+
+        Args:
+            file_path (str): CSV path, swapped to .parquet for Parquet storage.
+
+        Returns:
+            str: The Parquet path when that file is in use, otherwise file_path.
+        """
+        parquet_path = self._parquet_path(file_path)
+        if self.app_config.news.storage_format == "parquet" and os.path.exists(
+            parquet_path
+        ):
+            return parquet_path
+        return file_path
+
+    @staticmethod
+    def _parquet_path(file_path: str) -> str:
+        return os.path.splitext(file_path)[0] + ".parquet"
@@ -1,10 +1,41 @@
 from src.controllers.base_controller import BaseController
 import pandas as pd
-import os
-import ast  # For safely evaluating string representations of dictionaries
-import re  # For cleaning up content
+from hashlib import blake2b
+from typing import Iterable, Iterator
 from src.enums.messages_enum import Messages
-from src.models.sentiment_model import SentimentModelHandler
+from src.helpers.cache_helper import LRUCache
+from src.models.sentiment_model import get_sentiment_model
+
+# Raw article fields used during processing and their fallback values
+PROCESSING_DEFAULTS = {
+    "title": "No Title",
+    "description": "",
+    "content": "",
+    "publishedAt": "",
+    "source": "{}",
+    "url": "",
+    "sentiment_label": "NEUTRAL",
+    "sentiment_score": 0.0,
+}
+
+# Columns of a processed article, in output order
+PROCESSED_COLUMNS = [
+    "title",
+    "content",
+    "description",
+    "text",
+    "publishedAt",
+    "source",
+    "url",
+    "sentiment_label",
+    "sentiment_score",
+]
+
+# Sentiment predictions keyed by a hash of the article text, shared across requests
+PREDICTION_CACHE = LRUCache(maxsize=50_000)
+
+# Matches the name in a source dict or its string representation
+SOURCE_NAME_PATTERN = r"""'name':\s*(['"])(?P<name>.*?)\1"""
 
 
 class NewsController(BaseController):
@@ -32,79 +63,121 @@ class NewsController(BaseController):
             ValueError: If the query is not in the allowed list.
         """
         # Validate query against allowed queries in config.yaml
-        if query.lower() not in [
-            q.lower() for q in self.app_config.news.allowed_queries
-        ]:
+        if query.lower() not in self._allowed_queries_lc:
             raise ValueError(
                 f"Invalid query: '{query}'. Allowed queries are: {self.app_config.news.allowed_queries}"
             )
 
         # Generate API URL for query-based search
-        return self.app_config.news.query_url.format(
-            query=query,
-            api_key=self.env_config.NEWS_API_KEY,
-        )
+        return self._url_for(query=query)
 
-    def processing_data(self, news: list) -> list[dict]:
+    def deduplicate_articles(self, articles: list[dict]) -> list[dict]:
         """
-        Processes a list of news articles by extracting and combining content and descriptions.
+        Removes articles whose URL was already seen, keeping the first occurrence.
 
         Args:
-            news (list): A list of dictionaries containing news articles.
+            articles (list[dict]): A list of news articles.
 
         Returns:
-            list[dict]: A list of processed articles with title, content, description, and combined text.
+            list[dict]: The articles in their original order without duplicate URLs.
+                Articles without a URL are always kept.
         """
-        processed_articles = []
-        for article in news:
-            try:
-                # Skip if article is not a dictionary
-                if not isinstance(article, dict):
-                    # logger.warning
-                    print(f"Skipping invalid article: {article}")
+        seen = set()
+        unique_articles = []
+        for article in articles:
+            url = article.get("url") if isinstance(article, dict) else None
+            # Articles read back from CSV carry NaN for a missing URL
+            if isinstance(url, str) and url:
+                if url in seen:
                     continue
+                seen.add(url)
+            unique_articles.append(article)
+        return unique_articles
 
-                # Extract and clean fields
-                title = article.get("title", "No Title").strip()
-                description = article.get("description", "").strip()
-                content = article.get("content", "").strip()
-
-                # Clean up content (remove metadata like [+4155 chars])
-                content = re.sub(r"\[\+\d+ chars\]", "", content).strip()
-
-                # Parse the source field (string representation of a dictionary)
-                source = article.get("source", "{}")
-                try:
-                    source_dict = ast.literal_eval(
-                        source
-                    )  # Safely evaluate the string as a dictionary
-                    source_name = source_dict.get("name", "unknown")
-                except (ValueError, SyntaxError):
-                    source_name = "unknown"
-
-                # Build the processed article
-                processed_articles.append(
-                    {
-                        "title": title,
-                        "content": content,
-                        "description": description,
-                        "text": f"{description} {content}".strip(),
-                        "publishedAt": article.get("publishedAt", ""),
-                        "source": source_name,
-                        "url": article.get("url", ""),
-                        "sentiment_label": article.get("sentiment_label", "NEUTRAL"),
-                        "sentiment_score": float(article.get("sentiment_score", 0)),
-                    }
-                )
-            except Exception as e:
-                # logger.error
-                print(f"Error processing article: {e}")
-                continue
+    def processing_data(self, news: Iterable) -> list[dict]:
+        """
+        Processes news articles by extracting and combining content and descriptions.
 
-        if not processed_articles:
+        Args:
+            news (Iterable): A list or generator of dictionaries containing news articles.
+
+        Returns:
+            list[dict]: A list of processed articles with title, content, description, and combined text.
+        """
+        # Valid articles are streamed straight into a single DataFrame
+        df = pd.DataFrame(self._valid_articles(news), columns=list(PROCESSING_DEFAULTS))
+        if df.empty:
             print("No valid articles found after processing.")
+            return []
+
+        try:
+            df = df.fillna(PROCESSING_DEFAULTS)
+
+            # Extract and clean fields
+            for column in ["title", "description", "content"]:
+                df[column] = df[column].astype(str).str.strip()
+
+            # Clean up content (remove metadata like [+4155 chars])
+            df["content"] = (
+                df["content"]
+                .str.replace(r"\[\+\d+ chars\]", "", regex=True)
+                .str.strip()
+            )
+            df["text"] = (df["description"] + " " + df["content"]).str.strip()
+
+            df["source"] = self._source_names(df["source"])
+
+            df["sentiment_score"] = pd.to_numeric(
+                df["sentiment_score"], errors="coerce"
+            ).fillna(0.0)
+        except Exception as e:
+            # logger.error
+            print(f"Error processing articles: {e}")
+            return []
+
+        return df[PROCESSED_COLUMNS].to_dict("records")
+
+    @staticmethod
+    def _source_names(source: pd.Series) -> pd.Series:
+        """
+        Extracts the source name from each article's source field.
+
+        Sources are dicts when they come from the News API or Parquet storage and
+        their string representation when read back from CSV.
+
+        Args:
+            source (pd.Series): The raw source field of each article.
+
+        Returns:
+            pd.Series: Source names, "unknown" when missing.
+        """
+        is_dict = source.map(lambda value: isinstance(value, dict))
+        names = source[~is_dict].astype(str).str.extract(SOURCE_NAME_PATTERN)["name"]
+
+        if is_dict.any():
+            # Read dicts directly instead of round-tripping them through their repr
+            names = pd.concat([names, source[is_dict].str.get("name")])
 
-        return processed_articles
+        return names.reindex(source.index).fillna("unknown")
+
+    @staticmethod
+    def _valid_articles(news: Iterable) -> Iterator[dict]:
+        """
+        Yields only the articles that are dictionaries.
+
+        Args:
+            news (Iterable): Raw news articles.
+
+        Yields:
+            dict: A raw news article.
+        """
+        for article in news:
+            # Skip if article is not a dictionary
+            if not isinstance(article, dict):
+                # logger.warning
+                print(f"Skipping invalid article: {article}")
+                continue
+            yield article
 
     def save_raw_data(self, raw_articles: list[dict], file_path: str = None) -> str:
         """
@@ -123,14 +196,11 @@ class NewsController(BaseController):
         file_path = file_path or self.raw_data_path
 
         try:
-            # Ensure the directory exists
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
             # Convert list of dictionaries to DataFrame
             df = pd.DataFrame(raw_articles)
 
-            # Save DataFrame to CSV
-            df.to_csv(file_path, index=False, encoding="utf-8")
+            # Save DataFrame in the configured storage format
+            self.write_articles(df, file_path)
             return Messages.FETCH_SUCCESS.value
         except Exception as e:
             # Log the error if needed
@@ -149,8 +219,8 @@ class NewsController(BaseController):
         file_path = file_path or self.raw_data_path
 
         try:
-            # Read CSV file into DataFrame
-            df = pd.read_csv(file_path)
+            # Read stored articles into DataFrame
+            df = self.read_articles(file_path)
 
             # Convert DataFrame to list of dictionaries
             return df.to_dict("records")
@@ -179,19 +249,31 @@ class NewsController(BaseController):
         file_path = file_path or self.processed_data_path
 
         try:
-            # Ensure the directory exists
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
             # Convert list of dictionaries to DataFrame
             df = pd.DataFrame(processed_articles)
 
-            # Save DataFrame to CSV
-            df.to_csv(file_path, index=False, encoding="utf-8")
+            # Save DataFrame in the configured storage format
+            self.write_articles(df, file_path)
             return Messages.PROCESS_SUCCESS.value
         except Exception as e:
             # Log the error if needed
             return Messages.PROCESS_FAILURE.value
 
+    def get_sentiment_model(self):
+        """
+        Returns the process-wide sentiment model configured in config.yaml.
+
+        Returns:
+            SentimentModelHandler: The loaded sentiment model handler.
+        """
+        model_config = self.app_config.models.sentiment_analysis_model
+        return get_sentiment_model(
+            model_config.name,
+            model_config.max_length,
+            model_config.quantize,
+            model_config.backend,
+        )
+
     def predict_model(self, articles: list[dict]) -> list[dict]:
         """
         Applies sentiment analysis to each article and adds the prediction results.
@@ -206,20 +288,56 @@ class NewsController(BaseController):
             return articles
 
         try:
-            # Instantiate and load the sentiment model
-            sentiment_model = SentimentModelHandler(
-                model_name=self.app_config.models.sentiment_analysis_model.name,
-            )
-            sentiment_model.load_model()
-
-            # Apply sentiment prediction for each article based on the combined text field
+            # Reuse predictions for texts that were already scored
+            misses = []
             for article in articles:
-                text = article.get("text", "")
-                prediction = sentiment_model.predict(text)
-                article["sentiment_label"] = prediction.get("label", "NEUTRAL")
-                article["sentiment_score"] = prediction.get("score", 0.0)
+                key = self._text_key(article.get("text", ""))
+                prediction = PREDICTION_CACHE.get(key)
+                if prediction is None:
+                    misses.append((article, key))
+                else:
+                    self._set_prediction(article, prediction)
+
+            # Get the cached, already loaded sentiment model
+            sentiment_model = self.get_sentiment_model()
+
+            # Run sentiment prediction batch by batch, updating articles in place
+            batch_size = sentiment_model.batch_size
+            for start in range(0, len(misses), batch_size):
+                batch = misses[start : start + batch_size]
+                predictions = sentiment_model.predict_batch(
+                    [article.get("text", "") for article, _ in batch]
+                )
+                for (article, key), prediction in zip(batch, predictions):
+                    PREDICTION_CACHE.set(key, prediction)
+                    self._set_prediction(article, prediction)
         except Exception as e:
             # Log the error if needed
             raise
 
         return articles
+
+    @staticmethod
+    def _text_key(text: str) -> bytes:
+        """
+        Builds a compact cache key from the text sent to the sentiment model.
+
+        Args:
+            text (str): The article text.
+
+        Returns:
+            bytes: A 16-byte BLAKE2b digest of the text.
+        """
+        return blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    @staticmethod
+    def _set_prediction(article: dict, prediction: dict) -> None:
+        """
+        Copies a sentiment prediction onto an article.
+
+        Args:
+            article (dict): The article to update.
+            prediction (dict): The sentiment label and score.
+        """
+        article["sentiment_label"] = prediction.get("label", "NEUTRAL")
+        article["sentiment_score"] = prediction.get("score", 0.0)
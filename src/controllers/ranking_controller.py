@@ -1,10 +1,17 @@
-import pandas as pd
+import os
+import threading
 from src.controllers.base_controller import BaseController
+from src.enums.ranking_enum import RankingStrategy
 
 
 from src.models.ranking.financial_impact_ranking import FinancialImpactRanking
 from src.models.ranking.sentiment_ranking import RankBySentiment
 
+# Processed articles kept in memory as (file signature, DataFrame) and reloaded
+# only when a save replaces the file. Rankers never mutate their input frame.
+_ARTICLES_CACHE = None
+_ARTICLES_LOCK = threading.Lock()
+
 
 class RankingController(BaseController):
     """
@@ -21,24 +28,35 @@ class RankingController(BaseController):
         super().__init__()
         self.file_path = self.processed_data_path
         self.rankers = {
-            "market_importance": FinancialImpactRanking(),
-            "sentiment": RankBySentiment(),
+            RankingStrategy.MARKET_IMPORTANCE: FinancialImpactRanking(),
+            RankingStrategy.SENTIMENT: RankBySentiment(),
         }
 
     def load_news(self):
         """
-        Loads processed news articles from a CSV file.
+        Loads processed news articles, reusing the cached copy until the file changes.
 
         Returns:
             pd.DataFrame: DataFrame containing news articles.
         """
+        global _ARTICLES_CACHE
         try:
-            return pd.read_csv(self.file_path)
+            with _ARTICLES_LOCK:
+                stat = os.stat(self._stored_path(self.file_path))
+                # Size and inode catch rewrites within one coarse mtime tick
+                signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+                if _ARTICLES_CACHE is None or _ARTICLES_CACHE[0] != signature:
+                    _ARTICLES_CACHE = (signature, self.read_articles(self.file_path))
+                return _ARTICLES_CACHE[1]
         except Exception as e:
             print(f"Error loading news data: {e}")
             return None
 
-    def rank_news(self, ranking_type="market_importance", limit: int = None):
+    def rank_news(
+        self,
+        ranking_type: RankingStrategy = RankingStrategy.MARKET_IMPORTANCE,
+        limit: int = None,
+    ):
         """
         Enhanced with limit handling
         """
@@ -46,15 +64,7 @@ class RankingController(BaseController):
         if df is None or df.empty:
             return []
 
-        if ranking_type not in self.rankers:
-            raise ValueError(
-                f"Invalid ranking type: {ranking_type}. "
-                f"Available types: {list(self.rankers.keys())}"
-            )
-
-        ranked_df = self.rankers[ranking_type].rank(df)
-
-        # Convert to records before limiting
-        results = ranked_df.to_dict(orient="records")
+        # Limit before converting so only the returned rows become dicts
+        ranked_df = self.rankers[ranking_type].rank(df, top_k=limit)
 
-        return results[:limit] if limit else results
+        return ranked_df.to_dict(orient="records")
@@ -5,5 +5,7 @@ class Messages(Enum):
     FETCH_SUCCESS = "Successfully fetched news articles."
     FETCH_FAILURE = "Failed to fetch news articles."
     PROCESS_SUCCESS = "News processed and saved successfully."
+    PROCESS_COMPLETE = "News processed successfully."
     PROCESS_FAILURE = "Error occurred while processing news."
     MODEL_PREDICTION_FAILURE = "Sentiment prediction failed."
+    SAVE_SCHEDULED = "Articles are being saved in the background."
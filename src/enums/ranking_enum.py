@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class RankingStrategy(str, Enum):
+    MARKET_IMPORTANCE = "market_importance"
+    SENTIMENT = "sentiment"
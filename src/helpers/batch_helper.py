@@ -0,0 +1,108 @@
+import asyncio
+from concurrent.futures import Executor
+from contextlib import suppress
+from typing import Callable
+
+
+class MicroBatcher:
+    """
+    Coalesces items submitted by concurrent requests into shared batches.
+
+    A background task collects queued items until the batch is full or the wait
+    time runs out, processes them with one call, and hands each result back to
+    the request that submitted the item.
+
+    Attributes:
+        process_batch (Callable): Blocking function mapping a list of items to results.
+        executor (Executor): Executor the batch function runs in.
+        max_batch (int): Maximum number of items per batch.
+        max_wait (float): Maximum time in seconds to wait for a batch to fill up.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[list], list],
+        executor: Executor = None,
+        max_batch=64,
+        max_wait_ms=10,
+    ):
+        """
+        Initializes the batcher; call start() from a running event loop to use it.
+
+        Args:
+            process_batch (Callable): Blocking function mapping items to results.
+            executor (Executor): Executor the batch function runs in.
+            max_batch (int): Maximum number of items per batch (default: 64).
+            max_wait_ms (int): Maximum wait for a batch to fill up (default: 10 ms).
+        """
+        self.process_batch = process_batch
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue = None
+        self._task = None
+
+    def start(self):
+        """
+        Starts the background batching task on the running event loop.
+        """
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Stops the background batching task.
+        """
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+
+    async def submit(self, items: list) -> list:
+        """
+        Queues items for batched processing and waits for their results.
+
+        Args:
+            items (list): Items to process.
+
+        Returns:
+            list: The results, in the same order as the items.
+        """
+        loop = asyncio.get_running_loop()
+        futures = []
+        for item in items:
+            future = loop.create_future()
+            self._queue.put_nowait((item, future))
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
+
+    async def _run(self):
+        """
+        Collects queued items into batches and processes them until cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            items = [item for item, _ in batch]
+            try:
+                results = await loop.run_in_executor(
+                    self.executor, self.process_batch, items
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
@@ -0,0 +1,118 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+
+class LRUCache:
+    """
+    A thread-safe, size-bounded in-memory cache with least-recently-used eviction.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept in the cache.
+    """
+
+    def __init__(self, maxsize=50_000):
+        """
+        Initializes an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of entries kept in the cache (default: 50,000).
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        """
+        Returns the cached value for a key and marks it as recently used.
+
+        Args:
+            key: The cache key.
+            default: Value returned when the key is not cached.
+
+        Returns:
+            The cached value, or default if missing.
+        """
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key, value):
+        """
+        Stores a value, evicting the least recently used entry when full.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TTLCache:
+    """
+    A thread-safe in-memory cache whose entries expire after a fixed time-to-live.
+
+    Attributes:
+        ttl (float): Seconds an entry stays valid after it is stored.
+        maxsize (int): Maximum number of entries kept in the cache.
+    """
+
+    def __init__(self, ttl=60, maxsize=1024):
+        """
+        Initializes an empty cache.
+
+        Args:
+            ttl (float): Seconds an entry stays valid after it is stored (default: 60).
+            maxsize (int): Maximum number of entries kept in the cache (default: 1024).
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        """
+        Returns the cached value for a key if it has not expired.
+
+        Args:
+            key: The cache key.
+            default: Value returned when the key is missing or expired.
+
+        Returns:
+            The cached value, or default if missing or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key, value):
+        """
+        Stores a value, evicting the oldest entry when full.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+        """
+        with self._lock:
+            self._data[key] = (monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
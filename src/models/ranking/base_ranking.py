@@ -8,8 +8,12 @@ class RankingBase(ABC):
     """
 
     @abstractmethod
-    def rank(self, df: pd.DataFrame) -> pd.DataFrame:
+    def rank(self, df: pd.DataFrame, top_k: int = None) -> pd.DataFrame:
         """
         Ranks news articles based on specific criteria.
+
+        Args:
+            df (pd.DataFrame): News articles to rank.
+            top_k (int, optional): Return only the k best ranked articles.
         """
         pass
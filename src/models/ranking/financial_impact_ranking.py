@@ -1,8 +1,18 @@
+import numpy as np
 import pandas as pd
 import re
 from textblob import TextBlob
 from .base_ranking import RankingBase
 
+# Composite score weights per impact factor, in the order they are staged
+IMPACT_WEIGHTS = {
+    "sentiment_strength": 0.3,
+    "entity_density": 0.25,
+    "market_verbs": 0.2,
+    "novelty_score": 0.15,
+    "source_credibility": 0.1,
+}
+
 
 class FinancialImpactRanking(RankingBase):
     """
@@ -47,71 +57,152 @@ class FinancialImpactRanking(RankingBase):
             "buyback",
         }
 
-    def rank(self, df: pd.DataFrame) -> pd.DataFrame:
-        # Calculate impact factors
+        # Source credibility lookup table, joined against the source column
+        self._credibility = pd.Series(
+            {
+                "bloomberg": 0.95,
+                "reuters": 0.93,
+                "financial times": 0.90,
+                "cnbc": 0.85,
+            }
+        )
+        self._default_credibility = 0.5
+
+        # Compile patterns once instead of on every row
+        self._ticker_re = re.compile(r"\b[A-Z]{2,}\b")
+        # Inflected verb forms are matched against each article's word set.
+        # The word sets are already built for novelty, so this is cheaper than
+        # folding verbs into a combined keyword regex scanned with extractall,
+        # and mapping each form back to its verb keeps the original "which verbs
+        # appear" count, not one per inflected form or occurrence
+        self._verb_of = {
+            form: verb
+            for verb in self.market_verbs
+            for form in self._verb_inflections(verb)
+        }
+        self._verb_forms = frozenset(self._verb_of)
+        # Entities may span several words, so they are matched with one regex
+        self._entities_re = re.compile(
+            "|".join(
+                re.escape(entity)
+                for entity in sorted(self.financial_entities, key=len, reverse=True)
+            )
+        )
+
+    def rank(self, df: pd.DataFrame, top_k: int = None) -> pd.DataFrame:
+        text = df["text"].fillna("").astype(str)
+
+        # Tokenize once and share the unique words between the text factors
+        tokens = text.str.lower().str.findall(r"\w+")
+        unique_words = tokens.map(set)
+
+        # Calculate impact factors column-wise with vectorized string ops
         df = df.assign(
-            sentiment_strength=df["text"].apply(self._calculate_sentiment_strength),
-            entity_density=df["text"].apply(self._calculate_entity_density),
-            market_verbs=df["text"].apply(self._count_market_verbs),
-            novelty_score=df["text"].apply(self._calculate_novelty),
-            source_credibility=df["source"].apply(self._source_weight),
+            sentiment_strength=self._calculate_sentiment_strength(df, text),
+            entity_density=self._calculate_entity_density(text),
+            market_verbs=self._count_market_verbs(unique_words),
+            novelty_score=self._calculate_novelty(tokens, unique_words),
+            source_credibility=self._source_weight(df["source"]),
         )
 
         # Normalize scores
-        for col in [
+        factors = [
             "sentiment_strength",
             "entity_density",
             "market_verbs",
             "novelty_score",
-        ]:
-            df[col] = df[col].rank(pct=True)
-
-        # Composite impact score
-        df["market_impact"] = (
-            df["sentiment_strength"] * 0.3
-            + df["entity_density"] * 0.25
-            + df["market_verbs"] * 0.2
-            + df["novelty_score"] * 0.15
-            + df["source_credibility"] * 0.1
+        ]
+        df[factors] = df[factors].rank(pct=True)
+
+        # Composite impact score over the factors staged as one float matrix
+        scores = self._impact_scores(
+            df[list(IMPACT_WEIGHTS)].to_numpy(dtype=np.float64)
         )
+        df["market_impact"] = scores
+
+        return df.iloc[self._top_k_indices(scores, top_k)]
 
-        return df.sort_values(by="market_impact", ascending=False)
+    @staticmethod
+    def _impact_scores(factors: np.ndarray) -> np.ndarray:
+        """Weighted sum of the (articles x factors) matrix, one score per article"""
+        return factors @ np.fromiter(IMPACT_WEIGHTS.values(), dtype=np.float64)
 
-    def _calculate_sentiment_strength(self, text: str) -> float:
+    @staticmethod
+    def _top_k_indices(scores: np.ndarray, top_k: int = None) -> np.ndarray:
+        """Positions of the top_k highest scores in descending order"""
+        if top_k is not None and top_k <= 0:
+            return np.empty(0, dtype=np.intp)
+        if top_k is not None and top_k < len(scores):
+            # Select the top_k in O(N), then only sort those
+            indices = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            indices = np.arange(len(scores))
+        return indices[np.argsort(-scores[indices], kind="stable")]
+
+    def _calculate_sentiment_strength(
+        self, df: pd.DataFrame, text: pd.Series
+    ) -> pd.Series:
         """Measure both polarity and intensity of sentiment"""
+        # Reuse the FinBERT prediction from the processing step when available
+        if {"sentiment_label", "sentiment_score"}.issubset(df.columns):
+            score = pd.to_numeric(df["sentiment_score"], errors="coerce").fillna(0.0)
+            is_neutral = df["sentiment_label"].astype(str).str.lower() == "neutral"
+            return score.abs().where(~is_neutral, 0.0)
+
+        return text.apply(self._textblob_strength)
+
+    @staticmethod
+    def _textblob_strength(text: str) -> float:
+        """Fallback sentiment strength for articles without a model prediction"""
         analysis = TextBlob(text)
         return abs(analysis.sentiment.polarity) * analysis.sentiment.subjectivity
 
-    def _calculate_entity_density(self, text: str) -> int:
+    def _calculate_entity_density(self, text: pd.Series) -> pd.Series:
         """Count mentions of key financial terms and companies"""
-        text_lower = text.lower()
-        return sum(
-            1 for entity in self.financial_entities if entity in text_lower
-        ) + len(
-            re.findall(r"\b[A-Z]{2,}\b", text)
-        )  # Stock tickers
-
-    def _count_market_verbs(self, text: str) -> int:
+        # Each distinct entity counts once, tickers count every occurrence
+        entities = (
+            text.str.lower()
+            .str.findall(self._entities_re)
+            .map(lambda matches: len(set(matches)))
+        )
+        return entities + text.str.count(self._ticker_re)  # Stock tickers
+
+    def _count_market_verbs(self, unique_words: pd.Series) -> pd.Series:
         """Identify action verbs that typically move markets"""
-        return sum(
-            1
-            for verb in self.market_verbs
-            if re.search(rf"\b{verb}[ed|s|ing]*\b", text, re.I)
+        return unique_words.map(
+            lambda words: len({self._verb_of[w] for w in words & self._verb_forms})
         )
 
-    def _calculate_novelty(self, text: str) -> float:
+    @staticmethod
+    def _verb_inflections(verb: str) -> set[str]:
+        """List a verb and its inflections (e.g. cut, cuts, cutting)"""
+        if verb.endswith("e"):
+            stem = verb[:-1]
+            return {verb, f"{verb}s", f"{verb}d", f"{stem}ing"}
+        return {
+            verb,
+            f"{verb}s",
+            f"{verb}es",
+            f"{verb}ed",
+            f"{verb}ing",
+            f"{verb}{verb[-1]}ing",
+        }
+
+    def _calculate_novelty(
+        self, tokens: pd.Series, unique_words: pd.Series
+    ) -> pd.Series:
         """Measure content uniqueness using TF-IDF-like scoring"""
         # This would integrate with a historical news database
         # Placeholder implementation
-        return len(set(text.split())) / len(text.split())  # Unique word ratio
+        # Unique word ratio
+        return unique_words.map(len) / tokens.str.len().clip(lower=1)
 
-    def _source_weight(self, source: str) -> float:
+    def _source_weight(self, source: pd.Series) -> pd.Series:
         """Weight by source market influence"""
-        credibility_map = {
-            "bloomberg": 0.95,
-            "reuters": 0.93,
-            "financial times": 0.90,
-            "cnbc": 0.85,
-            "default": 0.5,
-        }
-        return credibility_map.get(source.lower(), credibility_map["default"])
+        return (
+            source.fillna("")
+            .astype(str)
+            .str.lower()
+            .map(self._credibility)
+            .fillna(self._default_credibility)
+        )
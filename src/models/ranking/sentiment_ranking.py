@@ -7,7 +7,17 @@ class RankBySentiment(RankingBase):
     Ranks news articles by sentiment type.
     """
 
-    def rank(self, df: pd.DataFrame) -> pd.DataFrame:
+    def rank(self, df: pd.DataFrame, top_k: int = None) -> pd.DataFrame:
         sentiment_order = {"NEGATIVE": 1, "POSITIVE": 2, "NEUTRAL": 3}
-        df["sentiment_rank"] = df["sentiment"].map(sentiment_order)
-        return df.sort_values(by="sentiment_rank")
+        # Unknown labels rank after every known sentiment
+        df = df.assign(
+            sentiment_rank=df["sentiment_label"]
+            .str.upper()
+            .map(sentiment_order)
+            .fillna(len(sentiment_order) + 1)
+        )
+
+        # Heap-based selection of the top_k instead of sorting every article
+        if top_k is not None and top_k < len(df):
+            return df.nsmallest(max(top_k, 0), "sentiment_rank", keep="first")
+        return df.sort_values(by="sentiment_rank", kind="stable")
@@ -1,17 +1,78 @@
-from transformers import pipeline
+import os
+import torch
+from functools import lru_cache
+from transformers import AutoTokenizer, pipeline
 from src.models.base_model import BaseModelHandler
 
 
 class SentimentModelHandler(BaseModelHandler):
-    def __init__(self, model_name: str):
+    def __init__(
+        self,
+        model_name: str,
+        max_length: int = 512,
+        batch_size: int = 32,
+        quantize: bool = False,
+        backend: str = "torch",
+        onnx_dir: str = "assets/onnx",
+    ):
         super().__init__(model_name)
+        self.max_length = max_length
+        self.batch_size = batch_size
+        self.quantize = quantize
+        self.backend = backend
+        self.onnx_dir = os.path.join(onnx_dir, model_name.replace("/", "--"))
         self.model = None
 
     def load_model(self):
         """Load the sentiment analysis model using the pipeline with an increased timeout."""
+        if self.backend == "onnx":
+            self.model = pipeline(
+                "sentiment-analysis",
+                model=self._load_onnx_model(),
+                tokenizer=AutoTokenizer.from_pretrained(self.model_name),
+            )
+            return
+
         # Increase request_timeout to 60 seconds
         self.model = pipeline("sentiment-analysis", model=self.model_name)
 
+        # Dynamic int8 quantization of the linear layers speeds up CPU inference
+        if self.quantize and self.model.device.type == "cpu":
+            self.model.model = torch.quantization.quantize_dynamic(
+                self.model.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+
+    def _load_onnx_model(self):
+        """
+        Load the model for ONNX Runtime, exporting (and quantizing) it on first use.
+
+        The exported model is kept in onnx_dir so later starts skip the export.
+        """
+        # Imported lazily, optimum is only needed for the ONNX backend
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+        file_name = "model_quantized.onnx" if self.quantize else "model.onnx"
+        if not os.path.exists(os.path.join(self.onnx_dir, file_name)):
+            model = ORTModelForSequenceClassification.from_pretrained(
+                self.model_name, export=True
+            )
+            model.save_pretrained(self.onnx_dir)
+
+            if self.quantize:
+                # Dynamic int8 quantization using AVX-512 VNNI instructions
+                quantizer = ORTQuantizer.from_pretrained(model)
+                quantizer.quantize(
+                    save_dir=self.onnx_dir,
+                    quantization_config=AutoQuantizationConfig.avx512_vnni(
+                        is_static=False, per_channel=False
+                    ),
+                )
+
+        return ORTModelForSequenceClassification.from_pretrained(
+            self.onnx_dir, file_name=file_name
+        )
+
     def predict(self, text: str):
         """
         Run sentiment analysis on the given text.
@@ -24,3 +85,60 @@ class SentimentModelHandler(BaseModelHandler):
             "label": result.get("label", "Neutral"),
             "score": result.get("score", 0.0),
         }
+
+    def predict_batch(self, texts: list[str]) -> list[dict]:
+        """
+        Run sentiment analysis on a list of texts in batched forward passes.
+
+        Empty texts are not sent to the model and get a neutral prediction. Texts
+        are sorted by length so each batch needs as little padding as possible.
+        """
+        predictions = [{"label": "Neutral", "score": 0.0} for _ in texts]
+        indices = sorted(
+            (i for i, text in enumerate(texts) if text.strip()),
+            key=lambda i: len(texts[i]),
+        )
+        if not indices:
+            return predictions
+
+        results = self.model(
+            [texts[i] for i in indices],
+            batch_size=self.batch_size,
+            truncation=True,
+            max_length=self.max_length,
+        )
+        for i, result in zip(indices, results):
+            predictions[i] = {
+                "label": result.get("label", "Neutral"),
+                "score": result.get("score", 0.0),
+            }
+        return predictions
+
+
+@lru_cache(maxsize=4)
+def get_sentiment_model(
+    model_name: str,
+    max_length: int = 512,
+    quantize: bool = False,
+    backend: str = "torch",
+) -> SentimentModelHandler:
+    """
+    Returns a loaded SentimentModelHandler, cached per model so weights load only once.
+
+    Args:
+        model_name (str): Name of the Hugging Face model.
+        max_length (int): Maximum number of tokens per text.
+        quantize (bool): Whether to quantize the model to int8 for CPU inference.
+        backend (str): Inference backend, "torch" or "onnx" (ONNX Runtime).
+
+    Returns:
+        SentimentModelHandler: Handler with the model already loaded.
+    """
+    handler = SentimentModelHandler(
+        model_name=model_name,
+        max_length=max_length,
+        quantize=quantize,
+        backend=backend,
+    )
+    handler.load_model()
+    return handler
@@ -1,91 +1,224 @@
-from fastapi import APIRouter, Query, Depends, HTTPException
-import requests
+import asyncio
+import logging
+from concurrent.futures import Executor
+from functools import lru_cache
+from typing import Callable
+from fastapi import APIRouter, BackgroundTasks, Query, Depends, HTTPException, Request
+import httpx
+import orjson
 from src.controllers.news_controller import NewsController
 from src.enums.messages_enum import Messages
+from src.helpers.cache_helper import TTLCache
 from config.app_config import load_config
-from src.helpers.log_helper import Logger  # Import logger helper
 
 news_router = APIRouter(prefix="/api/v1/data", tags=["api_v1_data"])
 
-# Initialize logger
-log_instance = Logger(log_name="api_requests_news")
-logger = log_instance.get_logger()
+# Configuration-derived constants, evaluated once at import
+_CONFIG = load_config()
+_ALLOWED = ", ".join(_CONFIG.news.allowed_queries)
+_DESC = f"Search for finance-related news ({_ALLOWED})"
+_ALLOWED_SET = frozenset(q.lower() for q in _CONFIG.news.allowed_queries)
 
+# Initialize logger (handlers are configured once in main.py)
+logger = logging.getLogger(__name__)
 
+# Fetched /fetch-raw-news articles by query; news only changes every few minutes
+_RESPONSE_CACHE = TTLCache(ttl=60)
+
+# In-flight News API calls by query, so identical concurrent requests share one
+_INFLIGHT_FETCHES: dict[str, asyncio.Task] = {}
+
+
+@lru_cache(maxsize=1)
 def get_news_controller():
     """
     Dependency injection function to provide a single instance of NewsController.
 
+    The instance is created once and shared by all requests.
+
     Returns:
         NewsController: An instance of the NewsController class.
     """
     return NewsController()
 
 
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """
+    Dependency injection function to provide the shared HTTP client.
+
+    Returns:
+        httpx.AsyncClient: The pooled client created at application startup.
+    """
+    return request.app.state.http_client
+
+
+async def run_blocking(executor: Executor, func: Callable, *args):
+    """
+    Runs a blocking controller call in an executor so the event loop stays free.
+
+    Args:
+        executor (Executor): The executor to run the call in.
+        func (Callable): The blocking function.
+        *args: Arguments passed to the function.
+
+    Returns:
+        The function's return value.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, func, *args)
+
+
+async def fetch_from_news_api(
+    request: Request, http_client: httpx.AsyncClient, query: str, url: str
+) -> httpx.Response:
+    """
+    Calls the News API, sharing a single upstream call between identical queries.
+
+    Outbound calls are bounded by the semaphore created at startup, so bursts of
+    requests queue in-process instead of hitting the News API rate limit.
+
+    Args:
+        request (Request): The incoming request, used to reach the shared semaphore.
+        http_client (httpx.AsyncClient): The shared HTTP client.
+        query (str): The search query, used to coalesce identical calls.
+        url (str): The formatted News API URL.
+
+    Returns:
+        httpx.Response: The News API response.
+    """
+
+    async def fetch():
+        async with request.app.state.news_api_semaphore:
+            return await http_client.get(url)
+
+    key = query.lower()
+    task = _INFLIGHT_FETCHES.get(key)
+    if task is None:
+        task = asyncio.create_task(fetch())
+        _INFLIGHT_FETCHES[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT_FETCHES.pop(key, None))
+
+    # Shielded so one client disconnecting does not cancel the shared call
+    return await asyncio.shield(task)
+
+
+def save_in_background(save: Callable, articles: list[dict]) -> None:
+    """
+    Runs a controller save after the response has been sent and logs its outcome.
+
+    Args:
+        save (Callable): The controller save method.
+        articles (list[dict]): The articles to save.
+    """
+    logger.info("Background save finished: %s", save(articles))
+
+
 @news_router.get("/fetch-raw-news")
 async def fetch_raw_news(
+    request: Request,
+    background_tasks: BackgroundTasks,
     query: str = Query(
         ...,
-        description=f"Search for finance-related news ({', '.join(load_config().news.allowed_queries)})",
+        description=_DESC,
     ),
     news_controller: NewsController = Depends(get_news_controller),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
 ):
     """
     Fetches raw finance-related news articles based on the given query and saves them to a file.
 
     Args:
+        request (Request): The incoming request, used to reach the shared executors.
+        background_tasks (BackgroundTasks): Runs the file save after the response is sent.
         query (str): The finance-related search term (e.g., "stock market").
         news_controller (NewsController): The dependency-injected instance of NewsController.
+        http_client (httpx.AsyncClient): The shared client used to call the News API.
 
     Returns:
         dict: JSON response containing raw news articles.
     """
-    logger.info(f"Received API request with query='{query}'")
+    logger.info("Received API request with query='%s'", query)
+
+    # Reject unsupported queries before any work or News API call
+    if query.lower() not in _ALLOWED_SET:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid query: '{query}'. Allowed queries are: {_ALLOWED}",
+        )
+
+    cache_key = f"news:{query.lower()}"
+    cached_articles = _RESPONSE_CACHE.get(cache_key)
+    if cached_articles is not None:
+        logger.info("Serving cached news for query='%s'", query)
+        # Save again so the raw news file matches the query served last, which
+        # /apply-sentiment reads next
+        background_tasks.add_task(
+            save_in_background, news_controller.save_raw_data, cached_articles
+        )
+        result = {
+            "message": Messages.FETCH_SUCCESS.value,
+            "save_status": Messages.SAVE_SCHEDULED.value,
+            "data": cached_articles,
+        }
+        return result
 
     try:
         # Generate API URL
         formatted_url = news_controller.process_api_link(query)
-        logger.info(f"Fetching news from API: {formatted_url}")
-        response = requests.get(formatted_url)
+        logger.info("Fetching news from API: %s", formatted_url)
+        response = await fetch_from_news_api(request, http_client, query, formatted_url)
 
         if response.status_code != 200:
-            logger.error(f"Failed to fetch news: {response.json()}")
+            # Log the raw body instead of parsing it, it may not even be JSON
+            logger.error(
+                "Failed to fetch news: %s %s", response.status_code, response.text[:512]
+            )
             return {"message": Messages.FETCH_FAILURE.value, "data": []}
 
         # Get raw articles
-        raw_articles = response.json().get("articles", [])
-        logger.info(f"Fetched {len(raw_articles)} articles successfully.")
+        raw_articles = news_controller.deduplicate_articles(
+            orjson.loads(response.content).get("articles", [])
+        )
+        logger.info("Fetched %d articles successfully.", len(raw_articles))
 
-        # Save raw articles to a file
-        save_status = news_controller.save_raw_data(raw_articles)
+        # Save raw articles to a file without delaying the response
+        background_tasks.add_task(
+            save_in_background, news_controller.save_raw_data, raw_articles
+        )
 
-        return {
+        _RESPONSE_CACHE.set(cache_key, raw_articles)
+        result = {
             "message": Messages.FETCH_SUCCESS.value,
-            "save_status": save_status,
+            "save_status": Messages.SAVE_SCHEDULED.value,
             "data": raw_articles,
         }
+        return result
 
     except ValueError as e:
-        logger.error(f"Validation Error: {e}")
+        logger.error("Validation Error: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
-    except requests.exceptions.RequestException as e:
-        logger.error(f"API Request Error: {e}")
+    except httpx.HTTPError as e:
+        logger.error("API Request Error: %s", e)
         return {"message": Messages.FETCH_FAILURE.value, "data": []}
 
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         return {"message": "An unexpected error occurred.", "data": []}
 
 
 @news_router.get("/apply-sentiment")
 async def apply_sentiment(
+    request: Request,
+    background_tasks: BackgroundTasks,
     news_controller: NewsController = Depends(get_news_controller),
 ):
     """
     Reads raw news articles from a file, performs sentiment analysis, and saves the results to another file.
 
     Args:
+        request (Request): The incoming request, used to reach the shared executors.
+        background_tasks (BackgroundTasks): Runs the file save after the response is sent.
         news_controller (NewsController): The dependency-injected instance of NewsController.
 
     Returns:
@@ -95,34 +228,44 @@ async def apply_sentiment(
 
     try:
         # Read raw articles from the file
-        raw_articles = news_controller.read_raw_data()
+        io_executor = request.app.state.io_executor
+        raw_articles = await run_blocking(io_executor, news_controller.read_raw_data)
+        raw_articles = news_controller.deduplicate_articles(raw_articles)
         if not raw_articles:
             logger.warning("No raw articles found to process.")
             return {"message": Messages.PROCESS_FAILURE.value, "data": []}
 
         # Process the articles
-        processed_articles = news_controller.processing_data(raw_articles)
+        processed_articles = await run_blocking(
+            io_executor, news_controller.processing_data, raw_articles
+        )
         if not processed_articles:
             logger.warning("No valid articles found after processing.")
             return {"message": Messages.PROCESS_FAILURE.value, "data": []}
 
         # Apply sentiment prediction to the articles
         try:
-            processed_articles = news_controller.predict_model(processed_articles)
+            # Batched with articles from concurrent requests on the model thread
+            processed_articles = await request.app.state.sentiment_batcher.submit(
+                processed_articles
+            )
             logger.info("Sentiment prediction completed successfully.")
         except Exception as pred_e:
-            logger.error(f"Error during sentiment prediction: {pred_e}")
+            logger.error("Error during sentiment prediction: %s", pred_e)
             return {"message": Messages.MODEL_PREDICTION_FAILURE.value, "data": []}
 
-        # Save processed articles to CSV
-        save_status = news_controller.save_processing_data(processed_articles)
+        # Save processed articles without delaying the response
+        background_tasks.add_task(
+            save_in_background, news_controller.save_processing_data, processed_articles
+        )
 
-        return {
-            "message": Messages.PROCESS_SUCCESS.value,
-            "save_status": save_status,
+        result = {
+            "message": Messages.PROCESS_COMPLETE.value,
+            "save_status": Messages.SAVE_SCHEDULED.value,
             "data": processed_articles,
         }
+        return result
 
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         return {"message": "An unexpected error occurred.", "data": []}
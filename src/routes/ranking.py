@@ -1,41 +1,42 @@
+from functools import lru_cache
 from fastapi import APIRouter, Query, HTTPException, Depends
 from src.controllers.ranking_controller import RankingController
 from src.controllers.base_controller import BaseController
+from src.enums.ranking_enum import RankingStrategy
 
 ranking_router = APIRouter(prefix="/api/v1/ranking", tags=["ranking"])
 
 
+@lru_cache(maxsize=1)
 def get_ranking_controller() -> RankingController:
+    # Created once so the rankers and their compiled patterns are reused
     return RankingController()
 
 
 @ranking_router.get("/news")
 async def rank_news(
-    ranking_type: str = Query(
-        default="market_importance",
+    ranking_type: RankingStrategy = Query(
+        default=RankingStrategy.MARKET_IMPORTANCE,
         description="Ranking strategy (market_importance, sentiment)",
     ),
-    limit: int = Query(default=10, description="Number of top articles to return"),
+    limit: int = Query(
+        default=10, ge=1, description="Number of top articles to return"
+    ),
     controller: RankingController = Depends(get_ranking_controller),
 ):
     """
     Get ranked financial news based on specified strategy
     """
     try:
-        # Get ranked articles
-        ranked_articles = controller.rank_news(ranking_type=ranking_type)
-
-        # Apply limit
-        limited_results = ranked_articles[:limit]
+        # Get the top ranked articles
+        limited_results = controller.rank_news(ranking_type=ranking_type, limit=limit)
 
         return {
-            "message": f"Successfully ranked using {ranking_type} strategy",
+            "message": f"Successfully ranked using {ranking_type.value} strategy",
             "count": len(limited_results),
-            "ranking_strategy": ranking_type,
+            "ranking_strategy": ranking_type.value,
             "data": limited_results,
         }
 
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Ranking failed: {str(e)}")